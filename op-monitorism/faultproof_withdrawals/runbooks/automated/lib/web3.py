@@ -5,8 +5,12 @@ from datetime import datetime, timezone
 import urllib3
 import os
 import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import sqlite3
+import pickle
 from pprint import pprint
-from datetime import datetime, timedelta
 
 # Disable warnings for insecure HTTPS requests
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -16,9 +20,29 @@ request_kwargs = {
     'verify': False  # Disable SSL verification
 }
 
+# Seconds a recent block stays cached, since it can still be reorged
+BLOCK_CACHE_TIME = 5.0
+# L1 blocks older than this many seconds (~128 L1 blocks) are treated as final and cached forever
+FINALIZED_BLOCK_AGE = 128 * 12
+
+# On-disk cache of immutable game data and finalized output roots, kept across process restarts
+DEFAULT_DISK_CACHE_PATH = os.path.expanduser(os.path.join("~", ".cache", "faultproof_withdrawals", "cache.sqlite3"))
+
+# Parsed ABI files keyed by absolute path, shared by every Web3Utility in the process
+_ABI_CACHE = {}
+
+def _load_abi(abi_path: str):
+    abi_path = os.path.abspath(abi_path)
+    abi = _ABI_CACHE.get(abi_path)
+    if abi is None:
+        with open(abi_path, 'r') as file:
+            abi = json.load(file)
+        _ABI_CACHE[abi_path] = abi
+    return abi
+
 class Web3Utility:
 
-    def __init__(self, l1_geth_url: str,l2_op_geth_url: str, l2_op_node_url: str,abi_folder_path:str, OptimismPortalProxyAddress:str,ignore_certificate: bool=False):
+    def __init__(self, l1_geth_url: str,l2_op_geth_url: str, l2_op_node_url: str,abi_folder_path:str, OptimismPortalProxyAddress:str,ignore_certificate: bool=False, check_connectivity: bool=False, disk_cache_path: str=DEFAULT_DISK_CACHE_PATH):
         self.OptimismPortal_abi_path=os.path.join(abi_folder_path,"OptimismPortal2.json")
         self.FaulDisputeGame_abi_path=os.path.join(abi_folder_path,"FaultDisputeGame.json")
         self.L2ToL1MessagePasser_abi_path=os.path.join(abi_folder_path,"L2ToL1MessagePasser.json")
@@ -27,67 +51,344 @@ class Web3Utility:
         self.l2_op_node_url = l2_op_node_url
         self.ignore_certificate=ignore_certificate
 
+        # Keep-alive session shared by the L1, L2 and op-node requests, sized for concurrent callers
+        self.http_session = requests.Session()
+        self.http_session.verify = not ignore_certificate
+        adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=urllib3.Retry(total=3, backoff_factor=0.1))
+        self.http_session.mount("http://", adapter)
+        self.http_session.mount("https://", adapter)
+
         if ignore_certificate:
-            self.l1_geth = Web3(Web3.HTTPProvider(l1_geth_url,request_kwargs=request_kwargs))
-            self.l2_op_geth = Web3(Web3.HTTPProvider(l2_op_geth_url,request_kwargs=request_kwargs))
+            self.l1_geth = Web3(Web3.HTTPProvider(l1_geth_url,request_kwargs=request_kwargs,session=self.http_session))
+            self.l2_op_geth = Web3(Web3.HTTPProvider(l2_op_geth_url,request_kwargs=request_kwargs,session=self.http_session))
         else:
-            self.l1_geth = Web3(Web3.HTTPProvider(l1_geth_url))
-            self.l2_op_geth = Web3(Web3.HTTPProvider(l2_op_geth_url))
-    
-        if not self.l1_geth.is_connected():
-            print(f"Failed to connect to Web3 l1_geth_url {l1_geth_url} provider.")
-        if not self.l2_op_geth.is_connected():
-            print(f"Failed to connect to Web3 l2_op_geth_url {l2_op_geth_url} provider.")
-
-      
-        OptimismPortal_contract_abi = None
-        with open( self.OptimismPortal_abi_path, 'r') as file:
-            OptimismPortal_contract_abi = json.load(file)
+            self.l1_geth = Web3(Web3.HTTPProvider(l1_geth_url,session=self.http_session))
+            self.l2_op_geth = Web3(Web3.HTTPProvider(l2_op_geth_url,session=self.http_session))
+
+        # Each check is an RPC round-trip, so they are opt-in and run in parallel
+        if check_connectivity:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                l1_connected, l2_connected = executor.map(lambda web3: web3.is_connected(), [self.l1_geth, self.l2_op_geth])
+            if not l1_connected:
+                print(f"Failed to connect to Web3 l1_geth_url {l1_geth_url} provider.")
+            if not l2_connected:
+                print(f"Failed to connect to Web3 l2_op_geth_url {l2_op_geth_url} provider.")
+
+
+        OptimismPortal_contract_abi = _load_abi(self.OptimismPortal_abi_path)
         self.OptimismPortal_contract_abi = OptimismPortal_contract_abi
 
         self.OptimismPortal2 = self.l1_geth.eth.contract(address=self.OptimismPortalProxyAddress, abi=OptimismPortal_contract_abi)
 
-        L2ToL1MessagePasser_contract_abi = None
-        with open( self.L2ToL1MessagePasser_abi_path, 'r') as file:
-            L2ToL1MessagePasser_contract_abi = json.load(file)
+        L2ToL1MessagePasser_contract_abi = _load_abi(self.L2ToL1MessagePasser_abi_path)
         self.L2ToL1MessagePasser_contract_abi = L2ToL1MessagePasser_contract_abi
 
         self.L2ToL1MessagePasser = self.l2_op_geth.eth.contract(address="0x4200000000000000000000000000000000000016",abi=L2ToL1MessagePasser_contract_abi)
 
+        FaulDisputeGame_contract_abi = _load_abi(self.FaulDisputeGame_abi_path)
+        self.FaulDisputeGame_contract_abi = FaulDisputeGame_contract_abi
+
+        # FaultDisputeGame contract objects, keyed by game proxy address
+        self._fault_dispute_games = {}
+        # (l2BlockNumber, rootClaim) keyed by game proxy address, both are immutable once the game is created
+        self._game_immutable_cache = {}
+        # op-node output roots of finalized L2 blocks keyed by L2 block number
+        self._output_root_cache = {}
+        # Highest L2 finalized block number reported by the op-node so far, finality never moves backward
+        self._l2_finalized_block_number = -1
+
+        # Set disk_cache_path to None to disable the on-disk cache
+        self.disk_cache_path = disk_cache_path
+        # Chain ids namespacing the disk cache keys, fetched lazily on first use
+        self._l1_chain_id = None
+        self._l2_chain_id = None
+        if disk_cache_path is not None:
+            try:
+                os.makedirs(os.path.dirname(disk_cache_path), exist_ok=True)
+            except Exception as e:
+                print(f"Error creating disk cache directory for {disk_cache_path}, disk cache disabled: {str(e)}")
+                self.disk_cache_path = None
+
+        # topic0 of WithdrawalProvenExtension1, used to scan raw logs without decoding them
+        self._wpe_topic0 = Web3.to_hex(Web3.keccak(text="WithdrawalProvenExtension1(bytes32,address)"))
+
+        # Latest WithdrawalProvenExtension1 event, kept up to date by watch_withdrawal_events
+        self._latest_wpe = None
+        self._withdrawal_event_watcher = None
+        self._withdrawal_event_watcher_stop = threading.Event()
+
+        # Blocks keyed by block number, stored as (block, expiry), one cache per Web3 instance
+        self._l1_block_cache = {}
+        self._l2_block_cache = {}
+
+    def _cache_block(self, block_cache: dict, block):
+        now = time.time()
+        if block_cache is self._l2_block_cache:
+            # L2 unsafe blocks can stay unfinalized far longer than FINALIZED_BLOCK_AGE when the batcher
+            # stalls, so only blocks the op-node reported as finalized are kept forever
+            final = block["number"] <= self._l2_finalized_block_number
+        else:
+            final = now - block["timestamp"] > FINALIZED_BLOCK_AGE
+        if final:
+            expiry = float("inf")
+        else:
+            expiry = now + BLOCK_CACHE_TIME
+        block_cache[block["number"]] = (block, expiry)
+
+    def _get_cached_block(self, block_cache: dict, blockNumber: int):
+        cached = block_cache.get(blockNumber)
+        if cached is not None and time.time() < cached[1]:
+            return cached[0]
+        return None
+
+    def _get_block(self, web3: Web3, block_cache: dict, blockNumber: int):
+        block = self._get_cached_block(block_cache, blockNumber)
+        if block is None:
+            block = web3.eth.get_block(blockNumber)
+            self._cache_block(block_cache, block)
+        return block
+
+    def _get_blocks(self, web3: Web3, block_cache: dict, blockNumbers: List[int]):
+        # Cached blocks are served locally, the rest are fetched in a single JSON-RPC batch
+        blocks = []
+        missing = []
+        for blockNumber in blockNumbers:
+            block = self._get_cached_block(block_cache, blockNumber)
+            if block is None:
+                missing.append(blockNumber)
+            else:
+                blocks.append(block)
+
+        if missing:
+            with web3.batch_requests() as batch:
+                batch.add_mapping({web3.eth.get_block: missing})
+                fetched = batch.execute()
+            for block in fetched:
+                self._cache_block(block_cache, block)
+            blocks.extend(fetched)
+        return blocks
+
+    def _disk_cache_connect(self):
+        # SQLite locks the file itself, so the cache is safe to share between threads, instances and
+        # processes (e.g. both triage notebooks running at once)
+        connection = sqlite3.connect(self.disk_cache_path, timeout=30)
+        connection.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+        return connection
+
+    def _disk_cache_get(self, key: str):
+        if self.disk_cache_path is None or key is None:
+            return None
+        try:
+            connection = self._disk_cache_connect()
+            try:
+                row = connection.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+            finally:
+                connection.close()
+            return pickle.loads(row[0]) if row is not None else None
+        except Exception as e:
+            print(f"Error reading disk cache {self.disk_cache_path}: {str(e)}")
+            return None
+
+    def _disk_cache_set(self, key: str, value):
+        if self.disk_cache_path is None or key is None:
+            return
+        try:
+            connection = self._disk_cache_connect()
+            try:
+                # Cached values are immutable, so the first writer wins
+                with connection:
+                    connection.execute("INSERT OR IGNORE INTO cache (key, value) VALUES (?, ?)", (key, pickle.dumps(value)))
+            finally:
+                connection.close()
+        except Exception as e:
+            print(f"Error writing disk cache {self.disk_cache_path}: {str(e)}")
+
+    def _game_disk_cache_key(self, gameProxyAddress:str):
+        # The same deployer and nonce give the same addresses on every network, devnet reset and fork,
+        # so addresses are only unique together with the chain id
+        if self.disk_cache_path is None:
+            return None
+        try:
+            if self._l1_chain_id is None:
+                self._l1_chain_id = self.l1_geth.eth.chain_id
+        except Exception as e:
+            print(f"Error: {str(e)}")
+            return None
+        return f"game:{self._l1_chain_id}:{gameProxyAddress}"
+
+    def _output_disk_cache_key(self, blockNumber:int):
+        if self.disk_cache_path is None:
+            return None
+        try:
+            if self._l1_chain_id is None:
+                self._l1_chain_id = self.l1_geth.eth.chain_id
+            if self._l2_chain_id is None:
+                self._l2_chain_id = self.l2_op_geth.eth.chain_id
+        except Exception as e:
+            print(f"Error: {str(e)}")
+            return None
+        return f"output:{self._l1_chain_id}:{self._l2_chain_id}:{self.OptimismPortalProxyAddress}:{blockNumber}"
+
     def get_fault_dispute_game(self, gameProxyAddress:str):
-        contract_abi = None
-        with open( self.FaulDisputeGame_abi_path, 'r') as file:
-            contract_abi = json.load(file)
-        FaulDisputeGame = self.l1_geth.eth.contract(address=gameProxyAddress, abi=contract_abi)
+        FaulDisputeGame = self._fault_dispute_games.get(gameProxyAddress)
+        if FaulDisputeGame is None:
+            FaulDisputeGame = self.l1_geth.eth.contract(address=gameProxyAddress, abi=self.FaulDisputeGame_contract_abi)
+            self._fault_dispute_games[gameProxyAddress] = FaulDisputeGame
         return FaulDisputeGame
 
-    def find_latest_withdrawal_event(self, starting_block_search:int, batch_size: int = 1000) -> List[Any]:
-        
+    def find_latest_withdrawal_event(self, starting_block_search:int, batch_size: int = 1000, max_batch_size: int = 50000, parallel_windows: int = 4, all_logs: bool = False) -> List[Any]:
+        """
+        Fetches the latest WithdrawalProvenExtension1 event by searching backward from the latest block.
+
+        The search window starts at `batch_size` blocks and doubles after every empty window,
+        up to `max_batch_size` blocks so that the range stays within common provider limits.
+        `parallel_windows` consecutive windows are queried concurrently.
+
+        Args:
+            starting_block_search (int): The lowest block to search.
+            batch_size (int, optional): Size of the first search window. Defaults to 1000.
+            max_batch_size (int, optional): Maximum size of a search window. Defaults to 50000.
+            parallel_windows (int, optional): Number of windows queried at the same time. Defaults to 4.
+            all_logs (bool, optional): Also return every event of the window holding the latest one, with their block timestamps. Defaults to False.
+
+        Returns:
+            Dict: A dictionary containing the latest event log, its timestamp, withdrawal hash and proof submitter, or None if no event is found.
+                With `all_logs`, it also contains "logs" and "timestamps" (block number to timestamp).
+
+        Raises:
+            Exception: If a window newer than the latest event found cannot be fetched, even after retrying and splitting it.
+        """
+
+        # Answered locally once watch_withdrawal_events is running and has seen an event. That event is the
+        # latest one overall, so if it is older than starting_block_search there is none in the range.
+        latest_wpe = self._latest_wpe
+        if latest_wpe is not None and not all_logs:
+            if latest_wpe["log"]["blockNumber"] >= starting_block_search:
+                return latest_wpe
+            return None
 
-        contract=self.OptimismPortal2
         latest_block = self.l1_geth.eth.block_number
-       
+
         starting_block_search = max(0, starting_block_search)
-        current_max_block = latest_block
+        span = batch_size
+        to_block = latest_block
+
+        executor = ThreadPoolExecutor(max_workers=parallel_windows)
+        try:
+            # Search backward in windows that double in size each time nothing is found
+            while to_block >= starting_block_search:
+                windows = []
+                while to_block >= starting_block_search and len(windows) < parallel_windows:
+                    from_block = max(starting_block_search, to_block - span + 1)
+                    windows.append((from_block, to_block))
+                    # Move the search window to the previous block range
+                    to_block = from_block - 1
+                    span = min(span * 2, max_batch_size)
+
+                futures = [executor.submit(self._get_withdrawal_proven_logs, from_block, window_to_block) for from_block, window_to_block in windows]
+
+                # Windows are ordered newest first, so the first non-empty one holds the latest event
+                for future in futures:
+                    logs = future.result()
+                    if logs:
+                        for pending in futures:
+                            pending.cancel()
+                        event = self.OptimismPortal2.events.WithdrawalProvenExtension1()
+                        if all_logs:
+                            # Fetch the timestamps of every log in one batch, which also fills the block cache
+                            decoded_logs = [event.process_log(log) for log in logs]
+                            timestamps = self.get_block_timestamps([log["blockNumber"] for log in decoded_logs])
+                            result = self._withdrawal_event_result(decoded_logs[-1])
+                            result.update({"logs": decoded_logs, "timestamps": timestamps})
+                            return result
+                        # Return the latest event found along with its timestamp, decoding only that log
+                        return self._withdrawal_event_result(event.process_log(logs[-1]))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return None
+
+    def _withdrawal_event_result(self, log):
+        timestamp_formatted = self.get_block_timestamp(log["blockNumber"])
+        return {"log": log, "timestamp": timestamp_formatted, "withdrawalHash": log["args"]["withdrawalHash"], "proofSubmitter": log["args"]["proofSubmitter"]}
+
+    def watch_withdrawal_events(self, starting_block_search:int, poll_interval: float = 12):
+        """
+        Keeps the latest WithdrawalProvenExtension1 event in memory so `find_latest_withdrawal_event` needs no RPC.
+
+        The latest event is seeded with one backward scan, then updated from an `eth_newFilter`
+        polled in a background thread. The filter is installed before the scan so that no event
+        emitted in between is missed. If a poll fails (filter timeout, node restart, provider
+        without filter support) the in-memory event is dropped, so callers fall back to scanning,
+        and the filter is reinstalled and reseeded on the next poll.
+
+        Args:
+            starting_block_search (int): The lowest block to search when seeding.
+            poll_interval (float, optional): Seconds between two filter polls. Defaults to 12.
+        """
+        if self._withdrawal_event_watcher is not None:
+            return
+
+        event_filter = self._install_withdrawal_event_filter(starting_block_search)
 
-        # Search in batches of `batch_size` blocks
-        while current_max_block >= starting_block_search:
+        self._withdrawal_event_watcher_stop.clear()
+        self._withdrawal_event_watcher = threading.Thread(target=self._poll_withdrawal_events, args=(event_filter, starting_block_search, poll_interval), daemon=True)
+        self._withdrawal_event_watcher.start()
+
+    def stop_watching_withdrawal_events(self):
+        """
+        Stops the background thread started by `watch_withdrawal_events`.
+        """
+        if self._withdrawal_event_watcher is None:
+            return
+        self._withdrawal_event_watcher_stop.set()
+        self._withdrawal_event_watcher.join()
+        self._withdrawal_event_watcher = None
+        self._latest_wpe = None
+
+    def _install_withdrawal_event_filter(self, starting_block_search:int):
+        # Cleared first so that the seeding scan below does not return the previous, possibly stale, event
+        self._latest_wpe = None
+        event_filter = self.OptimismPortal2.events.WithdrawalProvenExtension1.create_filter(from_block="latest")
+        self._latest_wpe = self.find_latest_withdrawal_event(starting_block_search)
+        return event_filter
+
+    def _poll_withdrawal_events(self, event_filter, starting_block_search:int, poll_interval: float):
+        while not self._withdrawal_event_watcher_stop.wait(poll_interval):
+            try:
+                if event_filter is None:
+                    event_filter = self._install_withdrawal_event_filter(starting_block_search)
+                    continue
+                entries = event_filter.get_new_entries()
+                if entries:
+                    self._latest_wpe = self._withdrawal_event_result(entries[-1])
+            except Exception as e:
+                print(f"Error polling WithdrawalProvenExtension1 filter: {str(e)}")
+                # Events may have been missed, so stop answering locally until the filter is reinstalled
+                self._latest_wpe = None
+                event_filter = None
+
+    def _get_withdrawal_proven_logs(self, from_block: int, to_block: int, attempts: int = 2, min_split_size: int = 1000):
+        # A failed window must never be treated as empty, or an older event would be reported as the latest
+        error = None
+        for attempt in range(attempts):
             try:
-                from_block = max(0, current_max_block - batch_size)
-                logs = contract.events.WithdrawalProvenExtension1().get_logs(from_block=from_block, to_block=current_max_block)
-                if logs:
-                    # Return the latest event found along with its timestamp
-                    last_log = logs[-1]
-                    block_number = last_log["blockNumber"]
-                    timestamp_formatted = self.get_block_timestamp(block_number)
-                    return {"log": last_log, "timestamp": timestamp_formatted}
+                return self.l1_geth.eth.get_logs({"address": self.OptimismPortalProxyAddress, "topics": [self._wpe_topic0], "fromBlock": from_block, "toBlock": to_block})
             except Exception as e:
-                print(f"Error fetching logs between blocks {from_block} and {current_max_block}: {str(e)}")
-            
-            # Move the search window to the previous `batch_size` block range
-            current_max_block = from_block
+                print(f"Error fetching logs between blocks {from_block} and {to_block}: {str(e)}")
+                error = e
+                if attempt + 1 < attempts:
+                    # Back off in case the provider is rate limiting the parallel windows
+                    time.sleep(0.5 * 2 ** attempt)
 
-        return None
+        # Range and result-size limits do not go away on retry, so search both halves of the window instead
+        if to_block - from_block + 1 > min_split_size:
+            middle = (from_block + to_block) // 2
+            older_logs = self._get_withdrawal_proven_logs(from_block, middle, attempts, min_split_size)
+            newer_logs = self._get_withdrawal_proven_logs(middle + 1, to_block, attempts, min_split_size)
+            return older_logs + newer_logs
+
+        raise Exception(f"Failed to fetch WithdrawalProvenExtension1 logs between blocks {from_block} and {to_block}") from error
 
     def get_withdrawal_proven_extension_1(self,txHash:str):
        
@@ -112,7 +413,7 @@ class Web3Utility:
                 dict: A dictionary containing the block number, timestamp, time since the last withdrawal, and formatted timestamp.
             """
 
-            block=self.l1_geth.eth.get_block(blockNumber)
+            block=self._get_block(self.l1_geth, self._l1_block_cache, blockNumber)
             timestamp=block["timestamp"]
 
             ret = {
@@ -122,78 +423,195 @@ class Web3Utility:
             }    
             return ret
 
-    def find_block_one_week_ago(self) -> int:
+    def get_block_timestamps(self, block_numbers: List[int]) -> dict:
+        """
+        Fetches the timestamps of several blocks, requesting the uncached ones in a single JSON-RPC batch.
+
+        Args:
+            block_numbers (list): The block numbers, duplicates are fetched once.
+
+        Returns:
+            dict: The timestamp of each block keyed by block number.
+        """
+        blocks = self._get_blocks(self.l1_geth, self._l1_block_cache, sorted(set(block_numbers)))
+        return {block["number"]: block["timestamp"] for block in blocks}
+
+    def find_block_one_week_ago(self, average_block_time: int = 12) -> int:
         """
         Finds the block number that is closest to one week ago from the current time.
 
+        The search interpolates a guess from the block timestamps and fetches a handful of
+        blocks around it, plus the midpoint of the bracketing blocks, in a single JSON-RPC batch,
+        narrowing the bracket each round.
+
+        Args:
+            average_block_time (int, optional): Expected seconds per block, used for the first guess. Defaults to 12.
+
         Returns:
-            int: The block number closest to one week ago.
+            int: The latest block whose timestamp is not after one week ago.
         """
-        
-        # Define the target timestamp (one week ago)
-        one_week_ago = datetime.utcnow() - timedelta(weeks=1)
-        target_timestamp = int(one_week_ago.timestamp())
 
-        # Get the latest block number
-        latest_block = self.l1_geth.eth.block_number
+        # Define the target timestamp (one week ago)
+        target_timestamp = int(time.time()) - 7 * 86400
 
-        # Logarithmic search to find a block close to one week ago
-        low = 0
-        high = latest_block
+        # Get the latest block
+        latest = self.l1_geth.eth.get_block("latest")
+        self._cache_block(self._l1_block_cache, latest)
+        if latest.timestamp <= target_timestamp:
+            return latest.number
 
-        while low <= high:
-            mid = (low + high) // 2
-            block = self.l1_geth.eth.get_block(mid)
-            block_timestamp = block.timestamp
+        # low is the newest block known to be at or before the target, high the oldest known after it
+        low, low_timestamp = 0, None
+        high, high_timestamp = latest.number, latest.timestamp
 
-            if block_timestamp < target_timestamp:
-                low = mid + 1
-            elif block_timestamp > target_timestamp:
-                high = mid - 1
+        while high - low > 1:
+            if low_timestamp is None:
+                guess = high - (high_timestamp - target_timestamp) // average_block_time
             else:
-                # Exact match found
-                return mid
+                guess = low + (target_timestamp - low_timestamp) * (high - low) // (high_timestamp - low_timestamp)
+
+            # Probe the guess and points at growing distances around it in one round-trip. The bracket
+            # midpoint is always probed too, so each round at least halves the range when block times
+            # are uneven and interpolation guesses badly.
+            probes = {guess, (low + high) // 2}
+            for offset in (1, 4, 16, 64, 256):
+                probes.update((guess - offset, guess + offset))
+            probes = sorted(b for b in probes if low < b < high)
+
+            for block in self._get_blocks(self.l1_geth, self._l1_block_cache, probes):
+                if block.timestamp <= target_timestamp:
+                    if block.number > low:
+                        low, low_timestamp = block.number, block.timestamp
+                elif block.number < high:
+                    high, high_timestamp = block.number, block.timestamp
+
+        return low
+
+    def get_game_data(self,withDrawalHash:str ,proofSubmitter:str, l2BlockNumberHint:int=None):
+        """
+        Fetches the dispute game data of a proven withdrawal.
+
+        Equivalent to `resolve_game` followed by `fetch_game_state`.
+
+        Args:
+            withDrawalHash (str | bytes): The withdrawal hash, as bytes or a hex string with or without 0x prefix.
+            proofSubmitter (str): The address that proved the withdrawal.
+            l2BlockNumberHint (int, optional): The L2 block number the game is expected to refer to.
 
-        # Fine-tune the search around the closest block found
-        closest_block = low if low < latest_block else high
-        while True:
-            block = self.l1_geth.eth.get_block(closest_block)
-            block_timestamp = block.timestamp
+        Returns:
+            dict: The game proxy address, proof timestamp, L2 block number, root claim, sentMessages flag and op-node output root.
+        """
+        withDrawalHash = self._withdrawal_hash_bytes(withDrawalHash)
 
-            if block_timestamp <= target_timestamp:
-                return closest_block
+        gameProxyAddress,timestamp=self.resolve_game(withDrawalHash,proofSubmitter)
+        gameState=self.fetch_game_state(gameProxyAddress,withDrawalHash,l2BlockNumberHint)
+        return {"gameProxyAddress":gameProxyAddress,"timestamp":timestamp,**gameState}
 
-            closest_block -= 1
+    def _withdrawal_hash_bytes(self, withDrawalHash):
+        # Accept "0x..." and bare hex strings as well as bytes/HexBytes, and always return plain bytes
+        if isinstance(withDrawalHash, str):
+            return bytes.fromhex(withDrawalHash[2:] if withDrawalHash.startswith("0x") else withDrawalHash)
+        return bytes(withDrawalHash)
 
+    def get_games_data(self, withdrawals: List[Any], max_workers: int = 8) -> List[Any]:
+        """
+        Fetches the dispute game data of several proven withdrawals concurrently.
 
-    
-    def get_game_data(self,withDrawalHash:str ,proofSubmitter:str):
-        if type(withDrawalHash) is str:
-            withDrawalHash = bytes.fromhex(withDrawalHash)
-        gameProxyAddress,timestamp=self.OptimismPortal2.functions.provenWithdrawals(withDrawalHash,proofSubmitter).call()
-        game=self.get_fault_dispute_game(gameProxyAddress)
-        l2BlockNumber=game.functions.l2BlockNumber().call()
-        rootClaim=game.functions.rootClaim().call()  
-     
-        sentMessages=self.L2ToL1MessagePasser.functions.sentMessages(withDrawalHash).call()
+        Args:
+            withdrawals (list): (withDrawalHash, proofSubmitter) pairs.
+            max_workers (int, optional): Number of withdrawals fetched at the same time. Defaults to 8.
 
+        Returns:
+            list: The `get_game_data` result of each withdrawal, in the same order as `withdrawals`.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda withdrawal: self.get_game_data(*withdrawal), withdrawals))
+
+    def resolve_game(self,withDrawalHash:bytes ,proofSubmitter:str):
+        """
+        Looks up the dispute game a withdrawal was proven against.
+
+        The result is never cached: a withdrawal can be proven again against another game, and an
+        unproven withdrawal returns the zero address until it is proven.
+
+        Args:
+            withDrawalHash (bytes): The withdrawal hash.
+            proofSubmitter (str): The address that proved the withdrawal.
+
+        Returns:
+            tuple: The game proxy address and the proof timestamp.
+        """
+        withDrawalHash=self._withdrawal_hash_bytes(withDrawalHash)
+        return tuple(self.OptimismPortal2.functions.provenWithdrawals(withDrawalHash,proofSubmitter).call())
+
+    def fetch_game_state(self,gameProxyAddress:str, withDrawalHash:bytes, l2BlockNumberHint:int=None):
+        """
+        Fetches the state needed to validate a withdrawal proven against a known dispute game.
+
+        The L2 sentMessages read runs concurrently with the L1 game reads. When `l2BlockNumberHint` is
+        given, the op-node output for that block is requested concurrently as well and is only
+        fetched again if the game turns out to refer to a different L2 block.
+
+        Args:
+            gameProxyAddress (str): The dispute game proxy address.
+            withDrawalHash (bytes): The withdrawal hash.
+            l2BlockNumberHint (int, optional): The L2 block number the game is expected to refer to.
+
+        Returns:
+            dict: The L2 block number, root claim, sentMessages flag and op-node output root.
+        """
+        withDrawalHash=self._withdrawal_hash_bytes(withDrawalHash)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sentMessagesFuture=executor.submit(self.L2ToL1MessagePasser.functions.sentMessages(withDrawalHash).call)
+            outputFuture=None
+            if l2BlockNumberHint is not None:
+                outputFuture=executor.submit(self._optimism_output_at_block_or_none,l2BlockNumberHint)
+
+            immutable=self._game_immutable_cache.get(gameProxyAddress)
+            if immutable is None:
+                diskKey=self._game_disk_cache_key(gameProxyAddress)
+                immutable=self._disk_cache_get(diskKey)
+                if immutable is None:
+                    game=self.get_fault_dispute_game(gameProxyAddress)
+                    with self.l1_geth.batch_requests() as batch:
+                        batch.add(game.functions.l2BlockNumber())
+                        batch.add(game.functions.rootClaim())
+                        l2BlockNumber,rootClaim=batch.execute()
+                    immutable=(l2BlockNumber,bytes(rootClaim))
+                    self._disk_cache_set(diskKey,immutable)
+                self._game_immutable_cache[gameProxyAddress]=immutable
+            l2BlockNumber,rootClaim=immutable
+
+            if l2BlockNumber == l2BlockNumberHint:
+                optimism_outputAtBlock=outputFuture.result()
+            else:
+                optimism_outputAtBlock=self._optimism_output_at_block_or_none(l2BlockNumber)
+            sentMessages=sentMessagesFuture.result()
+
+        return {"l2BlockNumber":l2BlockNumber,"rootClaim":f"0x{rootClaim.hex()}","sentMessages":sentMessages,"optimism_outputAtBlock":optimism_outputAtBlock}
+
+    def _optimism_output_at_block_or_none(self,blockNumber:int):
         try:
-            optimism_outputAtBlock=self.optimism_output_at_block(l2BlockNumber)
+            return self.optimism_output_at_block(blockNumber)
         except Exception as e:
             print(f"Error: {str(e)}")
-            optimism_outputAtBlock=None
-
-        return {"gameProxyAddress":gameProxyAddress,"timestamp":timestamp,"l2BlockNumber":l2BlockNumber,"rootClaim":f"0x{rootClaim.hex()}","sentMessages":sentMessages,"optimism_outputAtBlock":optimism_outputAtBlock}
-    
+            return None
 
     def optimism_output_at_block(self,blockNumber:int):
         # we need to do the equivalent of the following command
 
+        outputRoot = self._output_root_cache.get(blockNumber)
+        if outputRoot is not None:
+            return outputRoot
+
+        diskKey = self._output_disk_cache_key(blockNumber)
+        outputRoot = self._disk_cache_get(diskKey)
+        if outputRoot is not None:
+            self._output_root_cache[blockNumber] = outputRoot
+            return outputRoot
+
         url = self.l2_op_node_url
         block_number_hex = hex(blockNumber)
-        headers = {
-            "Content-Type": "application/json"
-        }
         data = {
             "jsonrpc": "2.0",
             "method": "optimism_outputAtBlock",
@@ -201,17 +619,29 @@ class Web3Utility:
             "id": 1
         }
 
-        # Send the POST request
-        response = requests.post(url, headers=headers, data=json.dumps(data),verify=not self.ignore_certificate)
+        # Send the POST request, requests serializes the payload and sets the JSON Content-Type
+        response = self.http_session.post(url, json=data)
         # Check if the request was successful
         if response.status_code == 200:
-            return response.json()["result"]["outputRoot"]
+            result = response.json()["result"]
+            outputRoot = result["outputRoot"]
+            # Only output roots of finalized L2 blocks are guaranteed never to change. Finality is taken from
+            # the sync status of the op-node that computed the root, and never moves backward.
+            try:
+                finalizedL2BlockNumber = int(result["syncStatus"]["finalized_l2"]["number"])
+            except (KeyError, TypeError, ValueError):
+                finalizedL2BlockNumber = -1
+            self._l2_finalized_block_number = max(self._l2_finalized_block_number, finalizedL2BlockNumber)
+            if blockNumber <= finalizedL2BlockNumber:
+                self._output_root_cache[blockNumber] = outputRoot
+                self._disk_cache_set(diskKey, outputRoot)
+            return outputRoot
         else:
             raise Exception(f"Error: {response.status_code} - {response.text}")
-        
+
     def getL2Block(self,blockNumber:int):
         try:
-            block=self.l2_op_geth.eth.get_block(blockNumber)
+            block=self._get_block(self.l2_op_geth, self._l2_block_cache, blockNumber)
             return block
         except Exception as e:
             print(f"Error: {str(e)}")